@@ -13,33 +13,88 @@ The following command-line arguments are supported:
   --output_directory: Directory to store output files. Outputs will be stored in data-dictionaries subfolder of this directory. (default: DataDictionaries/CleanedDataDictionaries)
   --hdp_id: HEAL project ID; defaults to the project identifier if not provided
   --appl_id: APPL ID (project award nunber), defaults to None. This is optional to provide.
+  --project_title: Project title, defaults to None (queried from the MDS). If given together with --appl_id, the MDS is not queried at all.
   --project_type: Study type (eg.HEAL Research Programs, HEAL  Research Networks, HEAL Study), (default="Research Programs")
   --overwrite: Option to overwrite existing VLMDs instead of asking to delete manually (default=False)
+  --max_workers: Maximum number of data dictionaries converted in parallel (default=min(8, number of CPUs))
+  --no_http_cache: Query the MDS over the network instead of using responses cached on disk for up to an hour (default=False)
 
 Example usage:
     ./scripts/convert2vlmd.py --clean_dd_directory input --output_directory output --hdp_id HDP12345--overwrite True --project_type "HEAL Study"
 """
+from __future__ import annotations
+
 import logging
+import multiprocessing
 import os
-import pandas as pd
 import shutil
-import re
-import yaml
-import requests
+import sqlite3
 import click
 
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from datetime import date
-from jsonschema import ValidationError
-from heal.vlmd import vlmd_extract, ExtractionError
+from typing import TYPE_CHECKING
+
+# Heavy third-party modules (pandas via heal-sdk, requests, yaml, ...) are imported inside
+# the functions that use them, so `--help` and argument errors return immediately.
+if TYPE_CHECKING:
+    import requests
 
 # Configure logging: adjust level and format as needed
 logging.basicConfig(level=logging.DEBUG, format="%(asctime)s [%(levelname)s] %(message)s")
 
-# print(json.dumps(input_short_descriptions, indent=2))
-pd.set_option("future.no_silent_downcasting", True)
+# Name of the on-disk cache for MDS responses, shared across runs of the script. It lives in
+# the user's own cache directory (e.g. ~/.cache/heal_http_cache.sqlite), not a shared temp path
+HTTP_CACHE_NAME = "heal_http_cache"
 
-def create_metadata_yaml(yaml_path: Path, hdp_id: str, appl_id: str, project_title: str, file_configs: dict, file_name: str, project_type: str = "HEAL Research Programs"):
+def build_session(http_cache: bool = True):
+    """
+    Build the HTTP session used for MDS queries.
+
+    All MDS queries go to healdata.org, so reusing one session keeps the connection alive
+    and avoids a new TLS handshake per request. With http_cache, GET responses are also
+    cached on disk for an hour so repeated runs do not hit the network at all. If the cache
+    database cannot be opened, a plain session is returned instead.
+
+    Parameters:
+        http_cache (bool): If True, return a requests_cache.CachedSession; otherwise a plain requests.Session.
+
+    Returns:
+        requests.Session: the configured session.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util import Retry
+
+    session = None
+    if http_cache:
+        from requests_cache import CachedSession
+        try:
+            session = CachedSession(HTTP_CACHE_NAME, backend="sqlite", use_cache_dir=True, expire_after=3600, allowable_methods=("GET",))
+        except sqlite3.Error as e:
+            logging.warning(f"HTTP cache unavailable ({e}); querying the MDS without it")
+    if session is None:
+        session = requests.Session()
+    session.headers.update({"Accept": "application/json"})
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])))
+    return session
+
+# (connect, read) timeouts for MDS requests: fail fast if healdata.org is unreachable,
+# but give the server time to assemble large responses
+MDS_TIMEOUT = (3.05, 30)
+
+SESSION = None
+
+def get_session():
+    """Return the shared MDS session, building it on first use."""
+    global SESSION
+    if SESSION is None:
+        SESSION = build_session()
+    return SESSION
+
+def create_metadata_yaml(yaml_path: Path, hdp_id: str, appl_id: str, project_title: str, file_configs: dict, file_name: str, project_type: str = "HEAL Research Programs", last_modified: str = None, keep_if_unchanged: bool = False):
     """
     Create a metadata YAML file with project details and file-specific configurations.
 
@@ -49,14 +104,23 @@ def create_metadata_yaml(yaml_path: Path, hdp_id: str, appl_id: str, project_tit
         appl_id (str): Application identifier.
         project_title (str): Title of the project.
         file_configs (dict): Dictionary containing configuration info for each file.
+        last_modified (str): ISO date recorded as LastModified; defaults to today.
+        keep_if_unchanged (bool): If True, leave an existing YAML alone when everything but LastModified already matches.
     """
+    import yaml
+    # Prefer the libyaml-backed dumper/loader; fall back to the pure-Python ones if PyYAML was built without them
+    try:
+        from yaml import CSafeDumper as YamlDumper, CSafeLoader as YamlLoader
+    except ImportError:
+        from yaml import SafeDumper as YamlDumper, SafeLoader as YamlLoader
+
     # Define the base project metadata
     config = {
         'Project': {
             'HDP_ID': hdp_id,
             'Filename': file_name,
             'ProjectType': project_type,
-            'LastModified': str(date.today()),
+            'LastModified': last_modified or str(date.today()),
             'ProjectTitle': project_title,
             'Status': 'READY'
         }
@@ -66,30 +130,104 @@ def create_metadata_yaml(yaml_path: Path, hdp_id: str, appl_id: str, project_tit
     # Merge file-specific configurations into the overall config
     config.update(file_configs)
 
-    # Write the configuration dictionary to the YAML file
-    with open(yaml_path, 'w') as f:
-        yaml.dump(config, f)
+    if keep_if_unchanged and yaml_path.exists():
+        with open(yaml_path, 'rb') as f:
+            existing = yaml.load(f, Loader=YamlLoader)
+        if isinstance(existing, dict) and isinstance(existing.get('Project'), dict):
+            if without_last_modified(existing) == without_last_modified(config):
+                logging.info(f"Metadata YAML at {yaml_path} is up to date")
+                return
+
+    # Serialize in memory, write it in a single call to a temporary file, then atomically
+    # swap it in so an interrupted run never leaves a truncated metadata.yaml behind
+    content = yaml.dump(config, Dumper=YamlDumper, default_flow_style=False)
+    tmp_path = yaml_path.with_suffix(yaml_path.suffix + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(content.encode('utf-8'))
+    os.replace(tmp_path, yaml_path)
     logging.info(f"Metadata YAML created at: {yaml_path}")
 
 
+def without_last_modified(config: dict):
+    """Returns a copy of a metadata YAML config with Project.LastModified removed, for comparisons."""
+    project = {key: value for key, value in config['Project'].items() if key != 'LastModified'}
+    return {**config, 'Project': project}
+
+
 def get_base_path():
     """Returns the base path by stripping the trailing directories."""
     return os.path.dirname(os.path.dirname(os.getcwd()))
 
 
+# Input type by file suffix, checked in order (a plain .csv is treated as a REDCap export)
+INPUT_TYPE_SUFFIXES = (
+    (".dta", "stata"),
+    (".data-dict.csv", "csv-data-dict"),
+    (".redcap.csv", "redcap-csv"),
+    (".csv", "redcap-csv"),
+)
+
 def detect_input_type(filepath: str):
     """Detects the appropriate input type based on file extension."""
-    if filepath.endswith(".dta"):
-        input_type= "stata"
-    elif filepath.endswith(".data-dict.csv"):
-        input_type="csv-data-dict"
-    elif filepath.endswith(".redcap.csv"):
-        input_type="redcap-csv"
-    elif filepath.endswith('.csv'):
-        input_type = "redcap-csv"
+    for suffix, input_type in INPUT_TYPE_SUFFIXES:
+        if filepath.endswith(suffix):
+            return input_type
+    return None
+
+def place_file(src: Path, dst: Path):
+    """
+    Place a copy of src at dst, avoiding a user-space byte copy where possible.
+
+    Uses an in-kernel os.copy_file_range (Linux; shares extents on copy-on-write
+    filesystems such as Btrfs/XFS) and falls back to shutil.copyfile. dst is always an
+    independent copy, never a link, so later edits to src do not change it. The copy is
+    made under a temporary name and then swapped in, so an existing file at dst is only
+    replaced once the new one is complete. If src and dst are the same path, nothing is done.
+    """
+    if os.path.realpath(src) == os.path.realpath(dst):
+        logging.info(f"{dst} is already the input file; leaving it in place")
+        return
+    tmp_dst = f"{dst}.tmp"
+    try:
+        with open(src, 'rb') as fsrc, open(tmp_dst, 'wb') as fdst:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+    except (AttributeError, OSError):
+        shutil.copyfile(src, tmp_dst)
+    os.replace(tmp_dst, dst)
+
+# Default cap on extraction worker processes; each one loads pandas and heal-sdk
+DEFAULT_MAX_WORKERS = min(8, os.cpu_count() or 1)
+
+# Where the study folders are published in the heal-data-dictionaries repository
+GITHUB_DATA_DICTIONARIES_URL = "https://github.com/heal-data-stewards/heal-data-dictionaries/tree/main/data-dictionaries"
+
+# Directories already ensured during this run, so repeat calls skip the mkdir syscall
+ENSURED_DIRS = set()
+
+def ensure_dir(path: Path):
+    """
+    Create a directory (and any missing parents) if it does not already exist.
+
+    Returns:
+        bool: True if the directory was created, False if it already existed.
+    """
+    if path in ENSURED_DIRS:
+        return False
+    try:
+        path.mkdir(parents=True)
+    except FileExistsError:
+        logging.info(f"Directory exists: {path}")
+        created = False
     else:
-        input_type = None
-    return input_type 
+        logging.info(f"Created directory: {path}")
+        created = True
+    ENSURED_DIRS.add(path)
+    return created
 
 def create_directory_structure(output_path: Path, hdp_id: str, project_name:str = None):
     """
@@ -113,15 +251,24 @@ def create_directory_structure(output_path: Path, hdp_id: str, project_name:str
     input_dir =  parent_path / "input"
     vlmd_dir = parent_path / "vlmd"
 
-    input_dir.mkdir(parents=True, exist_ok=True)
-    vlmd_dir.mkdir(parents=True, exist_ok=True)
+    if ensure_dir(parent_path):
+        # Freshly created, so the subdirectories cannot exist yet
+        input_dir.mkdir()
+        vlmd_dir.mkdir()
+        ENSURED_DIRS.update((input_dir, vlmd_dir))
+    else:
+        ensure_dir(input_dir)
+        ensure_dir(vlmd_dir)
 
     return parent_path
 
 
 def search_for_key(data, target_key):
     """
-    Recursively search for the first occurrence of a key in a nested data structure.
+    Search a nested data structure for the first occurrence of a key.
+
+    The structure is walked depth-first with an explicit stack rather than recursion,
+    so deeply nested responses cannot hit the recursion limit.
 
     Parameters:
         data: A dictionary or list to search.
@@ -130,21 +277,39 @@ def search_for_key(data, target_key):
     Returns:
         The value associated with target_key if found; otherwise, None.
     """
-    if isinstance(data, dict):
-        for key, value in data.items():
-            if key == target_key:
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            value = node.get(target_key)
+            if value is not None:
                 return value
-            result = search_for_key(value, target_key)
-            if result is not None:
-                return result
-    elif isinstance(data, list):
-        for item in data:
-            result = search_for_key(item, target_key)
-            if result is not None:
-                return result
+            # Reversed so children are visited in their original order.
+            stack.extend(reversed(node.values()))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
     return None
 
-def query_mds(query_params:dict):
+def mds_url(query_params:dict):
+    """
+    Build the MDS metadata URL for the information requested.
+
+    Parameters:
+        query_params (dict): Can either have {'hdp_id': <hdp_id>} OR
+                                             {'appl_id': <appl_id>}
+
+    Returns:
+        str: URL to query.
+    """
+    if 'hdp_id' in query_params:
+        return f"https://healdata.org/mds/metadata/{query_params['hdp_id']}"
+    elif 'appl_id' in query_params:
+        return f"https://healdata.org/mds/metadata?data=True&offset=0&nih_reporter.appl_id={query_params['appl_id']}"
+
+# Parsed MDS responses already fetched during this run, keyed by URL
+MDS_RESPONSES = {}
+
+def query_mds(query_params:dict, session: requests.Session = None):
     """
     Retrieve metadata JSON from a URL based on information requested.
 
@@ -154,41 +319,59 @@ def query_mds(query_params:dict):
     Parameters:
         query_params (dict): Can either have {'hdp_id': <hdp_id>} OR
                                              {'appl_id': <appl_id>}
+        session (requests.Session): Session used for the request; defaults to the shared session (see get_session).
+
+    Successful responses are remembered for the rest of the run, so repeated
+    queries for the same study do not go back to the MDS.
 
     Returns:
         data: JSON response if found else None.
     """
-    if 'hdp_id' in query_params:
-        url = f"https://healdata.org/mds/metadata/{query_params['hdp_id']}"
-    elif 'appl_id' in query_params:
-        url = f"https://healdata.org/mds/metadata?data=True&offset=0&nih_reporter.appl_id={query_params['appl_id']}"
-    
+    import orjson
+    import requests
+
+    url = mds_url(query_params)
+    # The same study is typically looked up more than once per run (title, then appl_id)
+    if url in MDS_RESPONSES:
+        return MDS_RESPONSES[url]
+
+    session = get_session() if session is None else session
     try:
-        response = requests.get(url)
+        try:
+            response = session.get(url, timeout=MDS_TIMEOUT)
+        except sqlite3.Error as e:
+            # Locked or unreadable cache database: query the MDS directly instead
+            logging.warning(f"HTTP cache unavailable ({e}); querying the MDS without it")
+            response = build_session(http_cache=False).get(url, timeout=MDS_TIMEOUT)
         response.raise_for_status()
-        data = response.json()
-    except requests.exceptions.RequestException as e:
+        data = orjson.loads(response.content)
+    except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
         logging.error(f"Error retrieving appl_id: {e}")
         data = None
+    else:
+        MDS_RESPONSES[url] = data
 
     return data
 
-def determine_appl_id(hdp_id:str):
+def determine_appl_id(hdp_id:str = None, session: requests.Session = None, mds_response: dict = None):
     """
-    Retrieve metadata JSON from a URL and search for any occurrence of the key 'appl_id'.
+    Search MDS metadata for any occurrence of the key 'appl_id'.
 
-    This function makes a request to the MDS, and
-        recursively searches the returned JSON for 'appl_id'.
+    If mds_response is not given, the metadata is fetched from the MDS for hdp_id first;
+    passing an already-fetched response avoids a second request.
 
     Parameters:
         hdp_id (str): The HDP identifier.
+        session (requests.Session): Optional session to query the MDS with.
+        mds_response (dict): Optional, already-fetched MDS record for the study.
 
     Returns:
-        str: The application ID if found; otherwise, an empty string.
+        str: The application ID if found; None if missing from the record; an empty string if the query failed.
     """
-    mds_response = query_mds({'hdp_id':hdp_id})
     if mds_response is None:
-        return ""
+        mds_response = query_mds({'hdp_id':hdp_id}, session=session)
+        if mds_response is None:
+            return ""
     # Should be careful wit this construction. Especially if there are multiple APPLIDs associated with one HDPID.
     found_appl_id = search_for_key(mds_response, "appl_id")
     if found_appl_id:
@@ -198,7 +381,7 @@ def determine_appl_id(hdp_id:str):
         logging.warning("appl_id not found in the JSON response.")
         return None
 
-def determine_hdp_id(appl_id:str):
+def determine_hdp_id(appl_id:str, session: requests.Session = None):
     """
     Retrieve metadata JSON from a URL and search for 'hdp_id' given an 'appl_id'
 
@@ -207,47 +390,269 @@ def determine_hdp_id(appl_id:str):
 
     Parameters:
         appl_id (str): The APPLID of the award.
+        session (requests.Session): Optional session to query the MDS with.
 
     Returns:
         str: The study HDPID if found; otherwise, an empty string.
     """
 
-    mds_response = query_mds({'appl_id':appl_id})
+    mds_response = query_mds({'appl_id':appl_id}, session=session)
     logging.info(f"Total keys in response: {len(mds_response)}")
     first_key = list(mds_response.keys())[0]
     hdp_id = mds_response[first_key]['gen3_discovery'].get('_hdp_uid', None)
     return hdp_id
 
-def fetch_project_metadata(hdp_id: str):
+def fetch_project_metadata(hdp_id: str = None, session: requests.Session = None, mds_response: dict = None):
     """
-    Fetch metadata from the HEAL data service for a given application and HDP identifier.
+    Fetch the project title from the HEAL data service for a given HDP identifier.
+
+    If mds_response is not given, the metadata is fetched from the MDS for hdp_id first;
+    passing an already-fetched response avoids a second request.
 
     Parameters:
         hdp_id (str): HDP identifier.
+        session (requests.Session): Optional session to query the MDS with.
+        mds_response (dict): Optional, already-fetched MDS record for the study.
 
     Returns:
-        tuple: (project_title, updated_hdp_id)
+        str: project title ('NOT FOUND' if missing), or None if the HDP ID was not found.
     """
     
     ## Use HDPID to query the MDS in order to get the project title
-    mds_response = query_mds({'hdp_id':hdp_id})
     if mds_response is None:
-        ## If HDPID not found in MDS, query by appl_id, and try to get thhe HDPID that way
-        logging.error("Given HDPID was not found in MDS. Check the HDPID, and rerun")
-        return None
-    project_title = "NOT FOUND"
-    project_title = mds_response['nih_reporter'].get('project_title', project_title) if 'nih_reporter' in mds_response else 'NOT FOUND'
+        mds_response = query_mds({'hdp_id':hdp_id}, session=session)
+        if mds_response is None:
+            ## If HDPID not found in MDS, query by appl_id, and try to get thhe HDPID that way
+            logging.error("Given HDPID was not found in MDS. Check the HDPID, and rerun")
+            return None
+    project_title = mds_response.get('nih_reporter', {}).get('project_title', 'NOT FOUND')
     
     if project_title == "NOT FOUND":
-        logging.info(f"Trying Cedar fields: {mds_response['gen3_discovery']['study_metadata']['minimal_info']}")
-        project_title = mds_response['gen3_discovery']['study_metadata']['minimal_info'].get('study_name', project_title) if \
-                            ('gen3_discovery' in mds_response and \
-                             'study_metadata' in mds_response['gen3_discovery'] and \
-                             'minimal_info' in mds_response['gen3_discovery']['study_metadata']
-                            ) else 'NOT FOUND'
+        # Walk gen3_discovery -> study_metadata -> minimal_info once; any missing level yields {}
+        minimal_info = mds_response.get('gen3_discovery', {}).get('study_metadata', {}).get('minimal_info', {})
+        logging.info(f"Trying Cedar fields: {minimal_info}")
+        project_title = minimal_info.get('study_name', project_title)
     return project_title
 
 
+def fetch_project_info(hdp_id: str, session: requests.Session = None):
+    """
+    Fetch the project title and APPL ID for an HDP identifier with a single MDS query.
+
+    The record is fetched once and handed to both `fetch_project_metadata` and
+    `determine_appl_id`.
+
+    Parameters:
+        hdp_id (str): HDP identifier.
+        session (requests.Session): Optional session to query the MDS with.
+
+    Returns:
+        tuple: (project_title, appl_id), or None if the HDP ID was not found.
+               project_title is 'NOT FOUND' and appl_id None when missing from the record.
+    """
+    mds_response = query_mds({'hdp_id':hdp_id}, session=session)
+    if mds_response is None:
+        logging.error("Given HDPID was not found in MDS. Check the HDPID, and rerun")
+        return None
+    return fetch_project_metadata(mds_response=mds_response), determine_appl_id(mds_response=mds_response)
+
+
+def init_extraction_worker(log_queue):
+    """
+    Prepare a worker process for `extract_file`.
+
+    Runs once per worker: routes the worker's log records to the parent through log_queue,
+    imports pandas (pulled in by heal-sdk anyway) and applies the pandas options the
+    extraction relies on, instead of doing so for every file.
+
+    Parameters:
+        log_queue (multiprocessing.Queue): Queue drained by a QueueListener in the parent process.
+    """
+    # Replace any inherited handlers so every record is written once, by the parent
+    logging.getLogger().handlers[:] = [QueueHandler(log_queue)]
+
+    import pandas as pd
+    pd.set_option("future.no_silent_downcasting", True)
+
+
+def vlmd_json_path(output_study_path: Path, file_path: Path, hdp_id: str):
+    """
+    Path of the VLMD JSON produced for a data dictionary: vlmd/<dd>/<hdp_id>_<dd>.json,
+    where <dd> is the file stem with spaces replaced by underscores.
+    """
+    dd_folder_name = file_path.stem.replace(" ", "_")
+    return output_study_path / "vlmd" / dd_folder_name / f"{hdp_id}_{dd_folder_name}.json"
+
+
+def same_contents(path_a: Path, path_b: Path, chunk_size: int = 1 << 20):
+    """
+    Compare two files byte by byte (after a size check).
+
+    filecmp.cmp is not used because it caches results by size and mtime, which is exactly
+    what cannot be trusted for files copied with their original timestamps.
+    """
+    if os.path.getsize(path_a) != os.path.getsize(path_b):
+        return False
+    with open(path_a, 'rb') as fa, open(path_b, 'rb') as fb:
+        while True:
+            chunk_a = fa.read(chunk_size)
+            if chunk_a != fb.read(chunk_size):
+                return False
+            if not chunk_a:
+                return True
+
+
+def is_up_to_date(file_path: Path, final_json_path: Path, staged_input_path: Path):
+    """
+    Check whether a data dictionary's extraction can be reused: its VLMD JSON exists and
+    is at least as new as the data dictionary, and the copy staged in input/ by the run
+    that produced it is byte-identical to the data dictionary.
+
+    The mtime comparison is only a cheap first filter; files copied with their original
+    timestamps (cp -p, rsync -a, archives) can be older than the JSON and still differ.
+    """
+    try:
+        if final_json_path.stat().st_mtime < file_path.stat().st_mtime:
+            return False
+        return same_contents(file_path, staged_input_path)
+    except FileNotFoundError:
+        return False
+
+
+def extract_file(
+    file_path: Path,
+    output_study_path: Path,
+    hdp_id: str
+):
+    """
+    Extract VLMD (JSON) from a single data dictionary using `vlmd_extract`.
+
+    This runs in a worker process (set up by `init_extraction_worker`) and only writes inside
+    the file's own vlmd/<dd>/ folder; copying the input and writing metadata.yaml are left
+    to the parent (see `write_file_outputs`).
+
+    Parameters:
+        file_path (Path): data dictionary file to process.
+        output_study_path (Path): base output directory for this study.
+        hdp_id (str): HEAL Data Platform identifier.
+
+    Returns:
+        tuple: (input_type, dd_folder_name, final_json_path) if the file has a valid VLMD
+               conversion, None if it was skipped or failed.
+    """
+    # We assume detect_input_type only controls logging/skipping; vlmd_extract auto‐detects format.
+    file_path_str = os.fspath(file_path)
+    input_type = detect_input_type(file_path_str)
+    if input_type is None:
+        logging.info(f"Skipping (non‐compliant) file: {file_path.name}")
+        return None
+
+    from jsonschema import ValidationError
+    from heal.vlmd import vlmd_extract, ExtractionError
+
+    logging.info(f">>> Processing file: {file_path.name}  (detected input_type = {input_type})")
+    final_json_path = vlmd_json_path(output_study_path, file_path, hdp_id)
+    output_dd_folder_path = final_json_path.parent
+    dd_folder_name = output_dd_folder_path.name
+    ensure_dir(output_dd_folder_path)
+
+    # vlmd_extract writes heal-dd_<stem>.json, which is then renamed to <hdp_id>_<stem>.json
+    emitted_name = f"heal-dd_{dd_folder_name}.json"
+    emitted_path = output_dd_folder_path / emitted_name
+
+    # 1) Run the new extractor
+    try:
+        vlmd_extract(
+            file_path_str,
+            title=dd_folder_name,
+            output_dir=str(output_dd_folder_path)
+        )
+
+        # 2) Verify it actually wrote heal-dd_<stem>.json
+        if not emitted_path.exists():
+            raise FileNotFoundError(
+                f"Expected output {emitted_name} in {output_dd_folder_path}"
+            )
+
+        # 3) Rename to prepend your HDP ID
+        emitted_path.replace(final_json_path)
+
+    except ValidationError as v_err:
+        logging.error(f"[ValidationError] {file_path.name} → {v_err}")
+        return None
+    except ExtractionError as e_err:
+        logging.error(f"[ExtractionError] {file_path.name} → {e_err}")
+        return None
+    except FileNotFoundError as fnf:
+        logging.error(f"[FileNotFoundError] {fnf}")
+        return None
+
+    return input_type, dd_folder_name, final_json_path
+
+
+def write_file_outputs(
+    file_path: Path,
+    input_dest_dir: Path,
+    github_study_url: str,
+    input_type: str,
+    dd_folder_name: str,
+    final_json_path: Path,
+    appl_id: str,
+    hdp_id: str,
+    project_title: str,
+    project_type: str,
+    last_modified: str = None,
+    keep_if_unchanged: bool = False
+):
+    """
+    Copy an extracted data dictionary to `input/` and generate its metadata.yaml.
+
+    Parameters:
+        file_path (Path): original data dictionary file.
+        input_dest_dir (Path): the study's input/ directory; must already exist.
+        github_study_url (str): GitHub URL of the study folder in heal-data-dictionaries.
+        input_type (str): input type detected for the file.
+        dd_folder_name (str): name of the file's folder under vlmd/.
+        final_json_path (Path): path of the extracted VLMD JSON.
+        appl_id (str): Application identifier.
+        hdp_id (str): HEAL Data Platform identifier.
+        project_title (str): Title of the project.
+        project_type (str): Type of the project (e.g., "clinical", "lab", etc.).
+        last_modified (str): ISO date recorded as LastModified in metadata.yaml.
+        keep_if_unchanged (bool): If True, keep an existing metadata.yaml whose contents already match.
+    """
+    # At this point, the JSON exists at final_json_path. Proceed to copy original CSV.
+    input_dest = input_dest_dir / file_path.name
+    place_file(file_path, input_dest)
+
+    # Build file_config (pointing at the .json under vlmd/, rather than .vlmd.csv)
+    # Note: GitHub URLs and relative paths are built from the known file names, independent of where the study folder lives.
+    json_subpath = f"{dd_folder_name}/{final_json_path.name}"
+    file_config = {
+        "inputtype": input_type,
+        "input_filepath": f"{github_study_url}/input/{input_dest.name}",
+        "output_filepath": f"{github_study_url}/vlmd/{json_subpath}",
+        "relative_input_filepath": f"../input/{input_dest.name}",
+        "relative_output_filepath": f"../{json_subpath}"
+    }
+
+    # Write metadata.yaml (using the same helper as before).
+    file_configs = {dd_folder_name: file_config}
+    create_metadata_yaml(
+        final_json_path.parent / "metadata.yaml",
+        hdp_id,
+        appl_id,
+        project_title,
+        file_configs,
+        dd_folder_name,
+        project_type,
+        last_modified,
+        keep_if_unchanged
+    )
+
+    logging.info(f"Successfully processed {file_path.name}; VLMD JSON at {final_json_path.name}")
+
+
 def process_files(
     clean_study_path: Path,
     output_study_path: Path,
@@ -255,12 +660,14 @@ def process_files(
     hdp_id: str,
     project_title: str,
     project_type: str,
-    overwrite: bool = False
+    overwrite: bool = False,
+    max_workers: int = None
 ):
     """
     Process CSV files by extracting VLMD (JSON) using `vlmd_extract`.  
     If extraction fails (schema or other), log and skip.
     On success, copy the original CSV to `input/` and generate metadata.yaml.
+    Extraction (`extract_file`) runs in a pool of worker processes.
 
     Parameters:
         clean_study_path (Path): directory with cleaned data dictionaries (CSVs).
@@ -269,119 +676,89 @@ def process_files(
         hdp_id (str): HEAL Data Platform identifier.
         project_title (str): Title of the project.
         project_type (str): Type of the project (e.g., "clinical", "lab", etc.).
-        overwrite (bool): If True, always re‐run extraction (even if JSON exists).
+        overwrite (bool): If True, always re‐run extraction, even for files whose VLMD JSON is up to date.
+        max_workers (int): Maximum number of worker processes; defaults to DEFAULT_MAX_WORKERS.
     """
     print(f"Looking for CSVs under: {clean_study_path}")
-    file_list = [f for f in clean_study_path.glob("*.csv") if not f.name.startswith(".")]
+    # Single directory read; DirEntry caches the file type so no extra stat per entry.
+    with os.scandir(clean_study_path) as entries:
+        file_list = sorted(
+            Path(entry.path) for entry in entries
+            if entry.name.endswith(".csv") and not entry.name.startswith(".") and entry.is_file()
+        )
     logging.info(f"Found {len(file_list)} CSV file(s) in {clean_study_path}")
     logging.debug(file_list)
 
-    valid_count = 0
+    # Loop-invariant locations shared by every file's outputs
+    input_dest_dir = output_study_path / "input"
+    ensure_dir(input_dest_dir)
+    github_study_url = f"{GITHUB_DATA_DICTIONARIES_URL}/{output_study_path.name}"
+    last_modified = str(date.today())
 
+    valid_count = 0
+    pending = []
     for file_path in file_list:
-        # We assume detect_input_type only controls logging/skipping; vlmd_extract auto‐detects format.
-        input_type = detect_input_type(str(file_path))
-        if input_type is None:
-            logging.info(f"Skipping (non‐compliant) file: {file_path.name}")
-            continue
-
-        logging.info(f">>> Processing file: {file_path.name}  (detected input_type = {input_type})")
-        dd_folder_name = file_path.stem.replace(" ", "_")
-        vlmd_subdir = f"vlmd/{dd_folder_name}"
-        output_dd_folder_path = output_study_path / vlmd_subdir
-        output_dd_folder_path.mkdir(parents=True, exist_ok=True)
-
-        metadata_yaml_path = output_dd_folder_path / "metadata.yaml"
-        overwrite_if_no_yaml = overwrite or not metadata_yaml_path.exists()
-
-        # Before calling vlmd_extract: if the JSON already exists and overwrite is False, skip.
-        # 1) Pre-check for an existing heal-dd_<stem>.json
-        emitted_name = f"heal-dd_{dd_folder_name}.json"
-        emitted_path = output_dd_folder_path / emitted_name
-
-        if emitted_path.exists() and not overwrite_if_no_yaml:
-            final_json_path = emitted_path
-            logging.info(
-                f"Skipping extraction; found existing {emitted_name} and overwrite=False"
+        # An unchanged source with a VLMD JSON from a previous run: skip the extraction, but
+        # still refresh metadata.yaml, which depends on the project options of this run
+        # (appl_id, title, type, ...).
+        final_json_path = vlmd_json_path(output_study_path, file_path, hdp_id)
+        if not overwrite and is_up_to_date(file_path, final_json_path, input_dest_dir / file_path.name):
+            logging.info(f"Skipping extraction of {file_path.name}: VLMD JSON is up to date (use --overwrite to regenerate)")
+            write_file_outputs(
+                file_path,
+                input_dest_dir,
+                github_study_url,
+                detect_input_type(os.fspath(file_path)),
+                final_json_path.parent.name,
+                final_json_path,
+                appl_id,
+                hdp_id,
+                project_title,
+                project_type,
+                last_modified,
+                keep_if_unchanged=True
             )
             valid_count += 1
-
         else:
-            # 2) Run the new extractor
-            try:
-                vlmd_extract(
-                    str(file_path),
-                    title=dd_folder_name,
-                    output_dir=str(output_dd_folder_path)
-                )
-
-                # 3) Verify it actually wrote heal-dd_<stem>.json
-                if not emitted_path.exists():
-                    raise FileNotFoundError(
-                        f"Expected output {emitted_name} in {output_dd_folder_path}"
-                    )
-
-                # 4) Rename to prepend your HDP ID, if needed
-                prefix = f"{hdp_id}_"
-                target_name = (
-                    f"{prefix}{dd_folder_name}.json"
-                    if not emitted_path.name.startswith(prefix)
-                    else emitted_path.name
+            pending.append(file_path)
+
+    # Files are independent of each other, so extract them in parallel across processes.
+    # The cheap bookkeeping (input/ copy, metadata.yaml) stays in this process.
+    workers = max(1, min(max_workers or DEFAULT_MAX_WORKERS, len(pending)))
+    # Workers log through a queue; the listener hands their records to this process's handlers
+    # so output from concurrent extractions is not interleaved mid-line.
+    log_queue = multiprocessing.Queue()
+    log_listener = QueueListener(log_queue, *logging.getLogger().handlers, respect_handler_level=True)
+    log_listener.start()
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=init_extraction_worker, initargs=(log_queue,)
+        ) as executor:
+            futures = {
+                executor.submit(extract_file, file_path, output_study_path, hdp_id): file_path
+                for file_path in pending
+            }
+            for future in as_completed(futures):
+                result = future.result()
+                if result is None:
+                    continue
+                input_type, dd_folder_name, final_json_path = result
+                write_file_outputs(
+                    futures[future],
+                    input_dest_dir,
+                    github_study_url,
+                    input_type,
+                    dd_folder_name,
+                    final_json_path,
+                    appl_id,
+                    hdp_id,
+                    project_title,
+                    project_type,
+                    last_modified
                 )
-                final_json_path = output_dd_folder_path / target_name
-                if emitted_path.name != target_name:
-                    emitted_path.rename(final_json_path)
-
-            except ValidationError as v_err:
-                logging.error(f"[ValidationError] {file_path.name} → {v_err}")
-                continue
-            except ExtractionError as e_err:
-                logging.error(f"[ExtractionError] {file_path.name} → {e_err}")
-                continue
-            except FileNotFoundError as fnf:
-                logging.error(f"[FileNotFoundError] {fnf}")
-                continue
-            else:
                 valid_count += 1
-
-        # At this point, the JSON exists at final_json_path. Proceed to copy original CSV.
-        input_dest_dir = output_study_path / "input"
-        input_dest_dir.mkdir(parents=True, exist_ok=True)
-
-        input_dest = input_dest_dir / file_path.name
-        shutil.copyfile(file_path, input_dest)
-
-        # Build file_config (pointing at the .json under vlmd/, rather than .vlmd.csv)
-        # Note: We replace local paths with GitHub URLs using regex substitutions.
-        file_config = {
-            "inputtype": input_type,
-            "input_filepath": re.sub(
-                r".*input/",
-                f"https://github.com/heal-data-stewards/heal-data-dictionaries/tree/main/data-dictionaries/{output_study_path.name}/input/",
-                str(input_dest)
-            ),
-            "output_filepath": re.sub(
-                r".*vlmd/",
-                f"https://github.com/heal-data-stewards/heal-data-dictionaries/tree/main/data-dictionaries/{output_study_path.name}/vlmd/",
-                str(final_json_path)
-            ),
-            "relative_input_filepath": re.sub(r".*input/", "../input/", str(input_dest)),
-            "relative_output_filepath": re.sub(r".*vlmd/", "../", str(final_json_path))
-        }
-
-        # Write metadata.yaml (using the same helper as before).
-        file_configs = {dd_folder_name: file_config}
-        create_metadata_yaml(
-            metadata_yaml_path,
-            hdp_id,
-            appl_id,
-            project_title,
-            file_configs,
-            dd_folder_name,
-            project_type
-        )
-
-        logging.info(f"Successfully processed {file_path.name}; VLMD JSON at {final_json_path.name}")
+    finally:
+        log_listener.stop()
 
     logging.info(
         f"Found {len(file_list)} file(s) in {clean_study_path}. "
@@ -413,6 +790,12 @@ def process_files(
     help="APPLID is the award number associated with this study. Optional argument",
     default=None
 )
+@click.option(
+    "--project_title",
+    type=str,
+    help="Title of the project. Optional argument; if given together with appl_id, the MDS is not queried",
+    default=None
+)
 @click.option(
     "--project",
     type=str,
@@ -431,20 +814,46 @@ def process_files(
     help="Option to overwrite existing VLMDs instead of asking to delete manually",
     default=False
 )
-def process_study_files(clean_study_directory:str, output_directory:str, hdp_id:str, appl_id:str, project:str, project_type:str, overwrite: bool):
+@click.option(
+    "--no_http_cache",
+    is_flag = True,
+    help="Always query the MDS over the network instead of using cached responses (useful for debugging)",
+    default=False
+)
+@click.option(
+    "--max_workers",
+    type=int,
+    help=f"Maximum number of data dictionaries converted in parallel (default: {DEFAULT_MAX_WORKERS})",
+    default=None
+)
+def process_study_files(clean_study_directory:str, output_directory:str, hdp_id:str, appl_id:str, project_title:str, project:str, project_type:str, overwrite: bool, no_http_cache: bool, max_workers: int):
 
-    # Fetch project metadata from the HEAL data service
-    logging.info("Getting Project Metadata from MDS")
-    project_title = fetch_project_metadata(hdp_id)
-    if project_title is None:
-        return
-    
-    ## If project title was not found, ask user if they would like to provide a project title.
-    if project_title=='NOT FOUND':
-        project_title = input("Querying MDS did not get the project title. Enter the project title: ")
+    if project_title is not None and appl_id is not None:
+        # Everything the metadata needs was given on the command line
+        logging.info("Project title and appl_id provided; skipping MDS query")
+        logging.warning(f"{hdp_id} is not checked against the MDS; make sure the HDPID is correct")
+    else:
+        session = build_session(http_cache=False) if no_http_cache else get_session()
+        if project_title is not None:
+            logging.info("Project title provided; querying MDS for appl_id only")
+            project_info = fetch_project_info(hdp_id, session=session)
+            if project_info is None:
+                return
+            appl_id = project_info[1]
+        else:
+            # Fetch project metadata from the HEAL data service
+            logging.info("Getting Project Metadata from MDS")
+            project_info = fetch_project_info(hdp_id, session=session)
+            if project_info is None:
+                return
+            project_title, found_appl_id = project_info
+
+            ## If project title was not found, ask user if they would like to provide a project title.
+            if project_title=='NOT FOUND':
+                project_title = input("Querying MDS did not get the project title. Enter the project title: ")
 
-    if appl_id is None:
-        appl_id = determine_appl_id(hdp_id=hdp_id)
+            if appl_id is None:
+                appl_id = found_appl_id
 
     logging.info("Creating output directory structure")
     # Set up required directory structure for outputs and temporary work
@@ -462,7 +871,7 @@ def process_study_files(clean_study_directory:str, output_directory:str, hdp_id:
 
     logging.info("Converting files using HEAL Data Utils tool")
     # Process each file and collect configuration details
-    process_files(clean_study_path=clean_study_path, output_study_path=output_study_path, hdp_id=hdp_id, appl_id=appl_id, project_title=project_title, project_type=project_type, overwrite=overwrite)
+    process_files(clean_study_path=clean_study_path, output_study_path=output_study_path, hdp_id=hdp_id, appl_id=appl_id, project_title=project_title, project_type=project_type, overwrite=overwrite, max_workers=max_workers)
     logging.info(f"DONE processing files in {clean_study_path}")
 
 if __name__ == "__main__":
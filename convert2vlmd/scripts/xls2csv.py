@@ -1,6 +1,5 @@
 #!/usr/bin/env python
 
-import pandas as pd
 import argparse
 import os
 
@@ -12,9 +11,13 @@ def clean_floats_to_ints(df):
     return df
 
 def excel_to_csv(input_file, output_file, sheet_name=0):
+    # pandas is imported here rather than at module level so `--help` stays fast
+    import pandas as pd
+
     df = pd.read_excel(input_file, sheet_name=sheet_name)
     df = clean_floats_to_ints(df)
-    df.to_csv(output_file, index=False)
+    with open(output_file, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+        df.to_csv(f, index=False)
 
 def main():
     parser = argparse.ArgumentParser(description='Convert Excel file to CSV.')
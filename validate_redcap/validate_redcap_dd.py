@@ -2,6 +2,8 @@ import requests
 import os
 import json
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 import sys
 
 load_dotenv()
@@ -33,7 +35,21 @@ payload = {
     "returnFormat": "json"
 }
 
-response = requests.post(api_url, data=payload)
+# Retry connection failures and transient gateway errors. Importing the same metadata
+# again is idempotent, so the POST is safe to retry. Once retries run out, the last
+# response is returned (raise_on_status=False) so it is reported below like any other error.
+retries = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=[502, 503, 504],
+    allowed_methods=frozenset({"POST"}),
+    raise_on_status=False
+)
+session = requests.Session()
+session.mount("https://", HTTPAdapter(max_retries=retries))
+session.mount("http://", HTTPAdapter(max_retries=retries))
+
+response = session.post(api_url, data=payload)
 
 if response.status_code == 200:
     response_data = response.json()